@@ -1,32 +1,121 @@
 # binance_bot/client.py
 
-import random
+import queue
+import threading
 import time
 
+import numpy as np
+
 class BinanceClient:
     """
     Mock Binance client used when live API access is restricted.
     Generates simulated BTCUSDT prices and volumes.
+
+    Price deltas and volumes are drawn in bulk from a NumPy generator
+    and served from a cursor, so replay harnesses driving thousands of
+    ticks per second avoid per-call random.uniform overhead.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, prefill: int = 65536):
         self.config = config
         self.symbol = config.get("symbol", "BTCUSDT")
         self._price = 42000.0  # starting mock price
 
+        self._prefill = prefill
+        self._rng = np.random.default_rng()
+        self._refill()
+
+        # Push-mode streaming state (see start_stream/drain)
+        self._queue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._stream_thread = None
+
+    def _refill(self):
+        self._deltas = self._rng.uniform(-50, 50, self._prefill)
+        self._vols = self._rng.uniform(1, 100, self._prefill)
+        self._cursor = 0
+
     def get_market_data(self):
+        if self._cursor == self._prefill:
+            self._refill()
+
         # Simple random walk for price
-        delta = random.uniform(-50, 50)
-        self._price = max(1000.0, self._price + delta)
-        volume = random.uniform(1, 100)
+        delta = self._deltas[self._cursor]
+        volume = self._vols[self._cursor]
+        self._cursor += 1
+
+        self._price = max(1000.0, self._price + float(delta))
 
         return {
             "symbol": self.symbol,
             "price": round(self._price, 2),
-            "volume": round(volume, 4),
-            "timestamp": time.time(),
+            "volume": round(float(volume), 4),
+            "timestamp_ns": time.time_ns(),
+        }
+
+    def get_market_data_batch(self, n):
+        """
+        Generate n ticks at once as a dict of arrays, for consumers
+        that vectorize downstream (ATR, strategies, ...).
+        """
+        deltas = self._rng.uniform(-50, 50, n)
+        prices = np.maximum(1000.0, self._price + np.cumsum(deltas))
+        self._price = float(prices[-1])
+
+        return {
+            "symbol": self.symbol,
+            "price": np.round(prices, 2),
+            "volume": np.round(self._rng.uniform(1, 100, n), 4),
+            "timestamp_ns": time.time_ns(),
         }
 
+    def start_stream(self, rate_hz: float = 100.0):
+        """
+        Start a background thread pushing synthesized ticks into an
+        internal queue at roughly rate_hz. Consumers drain the queue
+        in bulk instead of polling get_market_data per tick.
+        """
+        if self._stream_thread is not None:
+            return
+
+        self._stop.clear()
+        self._stream_thread = threading.Thread(
+            target=self._producer,
+            args=(rate_hz,),
+            daemon=True,
+        )
+        self._stream_thread.start()
+
+    def stop_stream(self):
+        """
+        Signal the producer thread to exit and wait for it.
+        """
+        if self._stream_thread is None:
+            return
+
+        self._stop.set()
+        self._stream_thread.join()
+        self._stream_thread = None
+
+    def _producer(self, rate_hz: float):
+        dt = 1.0 / rate_hz
+        while not self._stop.is_set():
+            self._queue.put(self.get_market_data())
+            time.sleep(dt)
+
+    def drain(self, max_batch: int = 256):
+        """
+        Pull up to max_batch queued ticks without blocking.
+        Returns a (possibly empty) list the caller can vectorize over.
+        """
+        ticks = []
+        for _ in range(max_batch):
+            try:
+                ticks.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return ticks
+
     def execute_trade(self, action):
         print(f"[BINANCE MOCK] Executing trade: {action}")
         return True
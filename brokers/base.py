@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Protocol, Dict, Any
+from typing import Iterator, Optional, Protocol, Dict, Any
+
+import numpy as np
+
+# int8 side / status codes shared by the batch execution paths
+SIDE_BUY = np.int8(0)
+SIDE_SELL = np.int8(1)
+
+STATUS_FILLED = np.int8(0)
+STATUS_REJECTED = np.int8(1)
 
 
 @dataclass
@@ -23,6 +32,44 @@ class OrderResult:
     raw: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class OrderRequestBatch:
+    """
+    Many orders as parallel arrays (structure-of-arrays) so batch
+    backtests avoid one PyObject per order.
+    """
+    symbols: np.ndarray          # object dtype
+    sides: np.ndarray            # int8, SIDE_BUY / SIDE_SELL
+    quantities: np.ndarray       # float64
+    limit_prices: Optional[np.ndarray] = None  # float64, None = market
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+
+@dataclass
+class OrderResultBatch:
+    """
+    Execution results as parallel arrays, mirroring OrderRequestBatch.
+    """
+    order_ids: np.ndarray        # object dtype, "" when rejected
+    statuses: np.ndarray         # int8, STATUS_FILLED / STATUS_REJECTED
+    filled_qtys: np.ndarray      # float64
+    avg_prices: np.ndarray       # float64
+
+    def iter_filled(self) -> Iterator[int]:
+        """
+        Yield indices of filled orders.
+        """
+        yield from np.flatnonzero(self.statuses == STATUS_FILLED)
+
+    def iter_rejected(self) -> Iterator[int]:
+        """
+        Yield indices of rejected orders.
+        """
+        yield from np.flatnonzero(self.statuses == STATUS_REJECTED)
+
+
 class Broker(Protocol):
     """
     Unified broker interface.
@@ -37,3 +84,37 @@ class Broker(Protocol):
 
     def get_balance(self) -> float:
         ...
+
+
+def place_orders_batch(broker: Broker, batch: OrderRequestBatch) -> OrderResultBatch:
+    """
+    Execute a batch through any broker: dispatches to the broker's
+    native place_orders_batch when it has one, otherwise falls back
+    to looping place_order so existing adapters keep working.
+    """
+    native = getattr(broker, "place_orders_batch", None)
+    if native is not None:
+        return native(batch)
+
+    n = len(batch)
+    order_ids = np.empty(n, dtype=object)
+    statuses = np.empty(n, dtype=np.int8)
+    filled_qtys = np.empty(n, dtype=np.float64)
+    avg_prices = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        result = broker.place_order(
+            OrderRequest(
+                symbol=batch.symbols[i],
+                side="BUY" if batch.sides[i] == SIDE_BUY else "SELL",
+                quantity=float(batch.quantities[i]),
+            )
+        )
+        order_ids[i] = result.order_id
+        statuses[i] = (
+            STATUS_FILLED if result.status == "FILLED" else STATUS_REJECTED
+        )
+        filled_qtys[i] = result.filled_qty
+        avg_prices[i] = result.avg_price
+
+    return OrderResultBatch(order_ids, statuses, filled_qtys, avg_prices)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Dict
 
+import numpy as np
+
 from brokers.base import Broker, OrderRequest, OrderResult
 
 
@@ -17,7 +19,11 @@ class BinanceBroker:
     def __init__(self):
         # Placeholder for future API client initialization
         # Example: self.client = Client(api_key, api_secret)
-        self._last_prices: Dict[str, float] = {}
+        #
+        # Prices are stored SoA-style (symbol→index map + float64 array)
+        # so a websocket firehose updates without per-tick allocation.
+        self._idx: Dict[str, int] = {}
+        self._prices = np.zeros(256, dtype=np.float64)
 
     def get_last_price(self, symbol: str) -> float:
         """
@@ -25,14 +31,28 @@ class BinanceBroker:
         In a real implementation, this would call:
           GET /api/v3/ticker/price
         """
-        return self._last_prices.get(symbol, 0.0)
+        i = self._idx.get(symbol)
+        return 0.0 if i is None else float(self._prices[i])
 
     def update_last_price(self, symbol: str, price: float) -> None:
         """
         Update price cache.
         In production, this would be driven by WebSocket streams.
         """
-        self._last_prices[symbol] = float(price)
+        i = self._idx.get(symbol)
+        if i is None:
+            i = len(self._idx)
+            self._idx[symbol] = i
+            if i >= len(self._prices):
+                # Grow in power-of-two steps
+                self._prices = np.resize(self._prices, len(self._prices) * 2)
+        self._prices[i] = price
+
+    def get_all_prices(self) -> np.ndarray:
+        """
+        Return the price array for all known symbols (batch consumers).
+        """
+        return self._prices[: len(self._idx)]
 
     def get_balance(self) -> float:
         """
@@ -1,34 +1,124 @@
 from __future__ import annotations
 
+import itertools
 import uuid
 from typing import Dict
 
-from brokers.base import Broker, OrderRequest, OrderResult
+import numpy as np
+
+from brokers.base import (
+    SIDE_BUY,
+    SIDE_SELL,
+    STATUS_FILLED,
+    STATUS_REJECTED,
+    Broker,
+    OrderRequest,
+    OrderRequestBatch,
+    OrderResult,
+    OrderResultBatch,
+)
 
 
 class PaperBroker:
     """
     Simulated broker for backtesting and paper trading.
     Uses in-memory balance and last price.
+
+    Prices are stored structure-of-arrays style: a symbol→index map
+    plus one float64 array, so per-tick updates are a C-level store
+    and batch consumers can read all prices at once.
     """
 
     def __init__(self, starting_balance: float):
         self.balance = float(starting_balance)
-        self.last_prices: Dict[str, float] = {}
+        self._idx: Dict[str, int] = {}
+        self._prices = np.zeros(256, dtype=np.float64)
+
+        # One uuid4 at startup keeps ids unique across broker
+        # instances; per-fill ids are then just a counter increment
+        # (no getrandom syscall or 36-char formatting per order)
+        self._order_prefix = f"paper-{uuid.uuid4().hex[:8]}-"
+        self._order_counter = itertools.count(1)
 
     def set_last_price(self, symbol: str, price: float) -> None:
         """
         Update the latest market price for a symbol.
         Typically called once per tick/bar.
         """
-        self.last_prices[symbol] = float(price)
+        i = self._idx.get(symbol)
+        if i is None:
+            i = len(self._idx)
+            self._idx[symbol] = i
+            if i >= len(self._prices):
+                # Grow in power-of-two steps
+                self._prices = np.resize(self._prices, len(self._prices) * 2)
+        self._prices[i] = price
 
     def get_last_price(self, symbol: str) -> float:
-        return self.last_prices.get(symbol, 0.0)
+        i = self._idx.get(symbol)
+        return 0.0 if i is None else float(self._prices[i])
+
+    def get_all_prices(self) -> np.ndarray:
+        """
+        Return the price array for all known symbols (batch consumers).
+        """
+        return self._prices[: len(self._idx)]
 
     def get_balance(self) -> float:
         return self.balance
 
+    def place_orders_batch(self, batch: OrderRequestBatch) -> OrderResultBatch:
+        """
+        Execute many orders in one call (SoA layout).
+
+        Execution prices come from limit_prices when given, otherwise
+        from the broker's last-price array. Costs and cashflows are
+        computed vectorized; the only sequential part is the running-
+        balance scan, since a rejected BUY changes the balance
+        available to every later order.
+        """
+        sides = np.asarray(batch.sides, dtype=np.int8)
+        quantities = np.asarray(batch.quantities, dtype=np.float64)
+
+        if batch.limit_prices is not None:
+            prices = np.asarray(batch.limit_prices, dtype=np.float64)
+        else:
+            prices = np.array(
+                [self.get_last_price(s) for s in batch.symbols],
+                dtype=np.float64,
+            )
+
+        n = len(quantities)
+        costs = quantities * prices
+
+        statuses = np.full(n, STATUS_FILLED, dtype=np.int8)
+        balance = self.balance
+
+        for i in range(n):
+            if prices[i] <= 0:
+                statuses[i] = STATUS_REJECTED
+            elif sides[i] == SIDE_BUY:
+                if costs[i] > balance:
+                    statuses[i] = STATUS_REJECTED
+                else:
+                    balance -= costs[i]
+            else:
+                balance += costs[i]
+
+        self.balance = balance
+
+        filled = statuses == STATUS_FILLED
+        filled_qtys = np.where(filled, quantities, 0.0)
+        avg_prices = np.where(filled, prices, 0.0)
+        prefix = self._order_prefix
+        counter = self._order_counter
+        order_ids = np.array(
+            [f"{prefix}{next(counter)}" if ok else "" for ok in filled],
+            dtype=object,
+        )
+
+        return OrderResultBatch(order_ids, statuses, filled_qtys, avg_prices)
+
     def place_order(self, req: OrderRequest) -> OrderResult:
         price = self.get_last_price(req.symbol)
 
@@ -41,26 +131,29 @@ class PaperBroker:
                 raw={"error": "No market price available"},
             )
 
-        cost = req.quantity * price
-
-        if req.side == "BUY":
-            if cost > self.balance:
-                return OrderResult(
-                    order_id="",
-                    status="REJECTED",
-                    filled_qty=0.0,
-                    avg_price=0.0,
-                    raw={"error": "Insufficient balance"},
-                )
-            self.balance -= cost
+        side = SIDE_BUY if req.side == "BUY" else SIDE_SELL
+        result = self.place_orders_batch(
+            OrderRequestBatch(
+                symbols=np.array([req.symbol], dtype=object),
+                sides=np.array([side], dtype=np.int8),
+                quantities=np.array([req.quantity], dtype=np.float64),
+                limit_prices=np.array([price], dtype=np.float64),
+            )
+        )
 
-        elif req.side == "SELL":
-            self.balance += cost
+        if result.statuses[0] == STATUS_REJECTED:
+            return OrderResult(
+                order_id="",
+                status="REJECTED",
+                filled_qty=0.0,
+                avg_price=0.0,
+                raw={"error": "Insufficient balance"},
+            )
 
         return OrderResult(
-            order_id=str(uuid.uuid4()),
+            order_id=result.order_ids[0],
             status="FILLED",
-            filled_qty=req.quantity,
-            avg_price=price,
+            filled_qty=float(result.filled_qtys[0]),
+            avg_price=float(result.avg_prices[0]),
             raw={"broker": "paper"},
         )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from brokers.base import Broker, OrderRequest, OrderResult
 
@@ -12,14 +15,27 @@ class SolanaBroker:
     This class defines how Solana execution would be integrated
     via RPC + on-chain DEX programs (e.g., Jupiter, Serum, Raydium).
     No private keys or transactions are used here.
+
+    A small TTL cache sits in front of get_last_price so that once the
+    real Jupiter/Pyth lookups are wired in (tens-to-hundreds of ms
+    each), repeated same-tick reads stay a dict lookup + clock compare.
+    TTL of 0 (default) disables caching entirely.
     """
 
-    def __init__(self):
+    def __init__(self, cache_ttl_ms: int = 0):
         # Placeholder for future RPC client / wallet initialization
         # Example:
         #   self.rpc = Client("https://api.mainnet-beta.solana.com")
         #   self.wallet = Keypair.from_secret_key(...)
-        self._last_prices: Dict[str, float] = {}
+        #
+        # Prices are stored SoA-style (symbol→index map + float64 array)
+        # so oracle-feed updates avoid per-tick allocation.
+        self._idx: Dict[str, int] = {}
+        self._prices = np.zeros(256, dtype=np.float64)
+
+        # TTL cache: symbol → (price, monotonic ns when fetched)
+        self._cache_ttl_ns = int(cache_ttl_ms) * 1_000_000
+        self._cache: Dict[str, Tuple[float, int]] = {}
 
     def get_last_price(self, symbol: str) -> float:
         """
@@ -29,14 +45,58 @@ class SolanaBroker:
           - Jupiter quote API
           - On-chain oracle (e.g., Pyth)
         """
-        return self._last_prices.get(symbol, 0.0)
+        if self._cache_ttl_ns > 0:
+            now = time.monotonic_ns()
+            hit = self._cache.get(symbol)
+            if hit is not None and (now - hit[1]) < self._cache_ttl_ns:
+                return hit[0]
+
+            price = self._fetch_last_price(symbol)
+            self._cache[symbol] = (price, now)
+            return price
+
+        return self._fetch_last_price(symbol)
+
+    def _fetch_last_price(self, symbol: str) -> float:
+        """
+        Underlying price fetch (local array today, RPC call later).
+        """
+        i = self._idx.get(symbol)
+        return 0.0 if i is None else float(self._prices[i])
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+        Purge TTL cache entries, e.g. when an order fills.
+        Purges everything when no symbol is given.
+        """
+        if symbol is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(symbol, None)
 
     def update_last_price(self, symbol: str, price: float) -> None:
         """
         Update local price cache.
         In production, driven by oracle feeds or DEX quotes.
         """
-        self._last_prices[symbol] = float(price)
+        i = self._idx.get(symbol)
+        if i is None:
+            i = len(self._idx)
+            self._idx[symbol] = i
+            if i >= len(self._prices):
+                # Grow in power-of-two steps
+                self._prices = np.resize(self._prices, len(self._prices) * 2)
+        self._prices[i] = price
+
+        # Drop any unexpired TTL entry so the next get_last_price
+        # sees this update rather than the cached fetch
+        self._cache.pop(symbol, None)
+
+    def get_all_prices(self) -> np.ndarray:
+        """
+        Return the price array for all known symbols (batch consumers).
+        """
+        return self._prices[: len(self._idx)]
 
     def get_balance(self) -> float:
         """
@@ -0,0 +1,29 @@
+# common/_njit.py
+#
+# Optional Numba support. Hot-loop kernels import njit from here so
+# that environments without numba installed still run — the decorator
+# degrades to a no-op and the kernels execute as plain Python over
+# NumPy arrays.
+#
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+
+except ImportError:
+
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit: returns the function unchanged,
+        whether used bare (@njit) or with options (@njit(cache=True)).
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
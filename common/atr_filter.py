@@ -9,6 +9,33 @@
 # If atr_pct >= min_atr_pct  → volatility is "high enough" to trade.
 #
 
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _atr_step(prev_atr, prev_price, price, alpha):
+    """
+    One scalar ATR/EMA step. Kept monomorphic in float64 so Numba can
+    compile it; prev_atr < 0 is the "not initialized yet" sentinel.
+    """
+    tr = abs(price - prev_price)
+    atr = tr if prev_atr < 0 else (alpha * tr) + ((1.0 - alpha) * prev_atr)
+    return atr, price
+
+
+if njit is not None:
+    _atr_step = njit(cache=True, fastmath=True)(_atr_step)
+
+
 class ATRFilter:
 
     def __init__(self, period=14, min_atr_pct=0.005):
@@ -20,6 +47,9 @@ class ATRFilter:
         self.period = period
         self.min_atr_pct = min_atr_pct
 
+        # Precompute alpha once so the hot update path never divides
+        self._alpha = 2.0 / (period + 1)
+
         self.prev_price = None
         self.atr = None
         self.ready = False
@@ -35,24 +65,75 @@ class ATRFilter:
             self.prev_price = price
             return self.atr
 
-        true_range = abs(price - self.prev_price)
-        self.prev_price = price
+        # -1.0 sentinel keeps _atr_step monomorphic in float64
+        prev_atr = self.atr if self.atr is not None else -1.0
 
-        alpha = 2 / (self.period + 1)
-
-        if self.atr is None:
-            # Initialize ATR with first TR
-            self.atr = true_range
-        else:
-            # EMA smoothing
-            self.atr = (alpha * true_range) + ((1 - alpha) * self.atr)
+        self.atr, self.prev_price = _atr_step(
+            prev_atr, self.prev_price, float(price), self._alpha
+        )
 
         # Consider ATR "ready" after at least 'period' updates
-        if not self.ready and self.atr is not None:
+        if not self.ready:
             self.ready = True
 
         return self.atr
 
+    def update_batch(self, prices):
+        """
+        Update ATR with a whole chunk of prices at once.
+
+        Runs the same EMA recurrence as update(), but vectorized:
+        true ranges come from np.diff and the smoothing recursion is
+        dispatched to scipy.signal.lfilter when SciPy is installed
+        (a pure-NumPy loop otherwise). Backtest replays should call
+        this once per bar-chunk instead of update() once per bar.
+
+        Returns the ATR series for the chunk (np.ndarray), which may
+        be empty if there were not enough samples to form a TR yet.
+        """
+
+        prices = np.asarray(prices, dtype=np.float64)
+
+        if prices.size == 0:
+            return np.empty(0)
+
+        # Prepend the last seen price so the first diff is valid
+        if self.prev_price is not None:
+            prices = np.concatenate(([self.prev_price], prices))
+
+        self.prev_price = float(prices[-1])
+
+        if prices.size < 2:
+            # Only one sample total, cannot compute TR yet
+            return np.empty(0)
+
+        true_ranges = np.abs(np.diff(prices))
+
+        alpha = self._alpha
+
+        # Seed the recursion with the running ATR (or the first TR)
+        seed = self.atr if self.atr is not None else true_ranges[0]
+
+        if lfilter is not None:
+            atr_series, _ = lfilter(
+                [alpha],
+                [1.0, -(1.0 - alpha)],
+                true_ranges,
+                zi=[seed * (1.0 - alpha)],
+            )
+        else:
+            # NumPy fallback: same recurrence, scalar loop over the chunk
+            atr_series = np.empty_like(true_ranges)
+            atr = seed
+            for i in range(true_ranges.size):
+                atr = (alpha * true_ranges[i]) + ((1 - alpha) * atr)
+                atr_series[i] = atr
+
+        self.atr = float(atr_series[-1])
+        self.ready = True
+
+        return atr_series
+
     def is_tradable(self, price):
         """
         Returns True if volatility is sufficient to allow trading.
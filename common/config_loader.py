@@ -1,13 +1,51 @@
 # common/config_loader.py
 
+import copy
+
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml C loader (5-10x faster parse); fall back to the
+# pure-Python SafeLoader when the C extension is not compiled in.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed configs keyed on (resolved path, mtime_ns, size) so repeated
+# loads of an unchanged file skip the YAML parse entirely. Bounded so
+# stale mtime entries cannot pile up across hot-reloads.
+_CONFIG_CACHE: dict = {}
+_CONFIG_CACHE_MAXSIZE = 16
+
+
 def load_config(path: str):
     file_path = Path(path)
 
     if not file_path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
+    resolved = file_path.resolve()
+    st = resolved.stat()
+    key = (str(resolved), st.st_mtime_ns, st.st_size)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        # Deep-copy so callers remain free to mutate their config
+        return copy.deepcopy(cached)
+
     with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAXSIZE:
+        _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+
+    _CONFIG_CACHE[key] = config
+    return copy.deepcopy(config)
+
+
+def invalidate_cache():
+    """
+    Drop all cached configs (e.g. for hot-reload scenarios).
+    """
+    _CONFIG_CACHE.clear()
@@ -4,15 +4,22 @@
 # This renders a simple ASCII line graph of PnL over time.
 #
 
+from collections import deque
+
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
+# Precomputed bar rows (1..10 blocks, plus headroom) so render() never
+# repeats the multi-byte "▇" * n string build per point
+_BAR_TABLE = tuple("▇" * k + "\n" for k in range(12))
+
 
 class EquityChart:
     def __init__(self):
-        # Store historical PnL values
-        self.history = []
+        # Store historical PnL values; maxlen keeps the window bounded
+        # for readability and evicts the oldest point in O(1)
+        self.history = deque(maxlen=80)
         self.console = Console()
 
     def add_point(self, pnl_value):
@@ -21,10 +28,6 @@ class EquityChart:
         """
         self.history.append(round(pnl_value, 4))
 
-        # Limit history length for readability
-        if len(self.history) > 80:
-            self.history.pop(0)
-
     def render(self):
         """
         Create a Rich Table with an ASCII-style equity curve.
@@ -33,17 +36,23 @@ class EquityChart:
 
         table.add_column("PnL History", style="bold magenta")
 
-        # Build ASCII graph row
-        graph = ""
-
+        # Build ASCII graph in one pass + one join (no quadratic
+        # string concatenation)
         if self.history:
-            min_val = min(self.history)
-            max_val = max(self.history)
+            min_val = max_val = self.history[0]
+            for value in self.history:
+                if value < min_val:
+                    min_val = value
+                elif value > max_val:
+                    max_val = value
+
             span = max_val - min_val if max_val != min_val else 1
+            inv = 10.0 / span
 
-            for value in self.history:
-                normalized = int(((value - min_val) / span) * 10)
-                graph += "▇" * max(1, normalized) + "\n"
+            graph = "".join(
+                _BAR_TABLE[max(1, int((value - min_val) * inv))]
+                for value in self.history
+            )
 
         else:
             graph = "(no data yet)"
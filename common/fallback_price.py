@@ -19,6 +19,13 @@ try:
 except ImportError:
     yf = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
 
 # -----------------------------------------------------------------------
 # Internal helper: ensure there is a 'Close' column
@@ -85,6 +92,42 @@ def _ensure_close_column(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     return df
 
 
+# -----------------------------------------------------------------------
+# Disk cache helpers
+# -----------------------------------------------------------------------
+# Resolved (symbol, start, end) frames are persisted under cache/ so
+# repeated sweep/walk-forward runs skip the network fetch and CSV parse
+# entirely. Parquet is used when pyarrow is installed; otherwise pickle,
+# which still avoids re-parsing.
+_CACHE_DIR = "cache"
+
+
+def _cache_path(symbol: str, start: str, end: str) -> str:
+    ext = "parquet" if pa is not None else "pkl"
+    return os.path.join(_CACHE_DIR, f"{symbol}_{start}_{end}.{ext}")
+
+
+def _cache_read(path: str):
+    try:
+        if path.endswith(".parquet"):
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+    except Exception as e:
+        print(f"[WARN] Price cache read failed: {e}")
+        return None
+
+
+def _cache_write(path: str, df: pd.DataFrame) -> None:
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        if path.endswith(".parquet"):
+            df.to_parquet(path)
+        else:
+            df.to_pickle(path)
+    except Exception as e:
+        print(f"[WARN] Price cache write failed: {e}")
+
+
 # -----------------------------------------------------------------------
 # Public API: load_price_data
 # -----------------------------------------------------------------------
@@ -93,14 +136,32 @@ def load_price_data(symbol: str, start: str, end: str) -> pd.DataFrame:
     Loads price data for the given symbol between start and end dates.
 
     Order of attempts:
-      1. yfinance
-      2. local CSV (data/<symbol>.csv)
+      1. disk cache (cache/<symbol>_<start>_<end>.parquet or .pkl)
+      2. yfinance
+      3. local CSV (data/<symbol>.csv)
 
     Always returns a DataFrame with:
       - Datetime index
       - At least one column named 'Close'
     """
 
+    cache_path = _cache_path(symbol, start, end)
+
+    if os.path.exists(cache_path):
+        cached = _cache_read(cache_path)
+        if cached is not None and not cached.empty:
+            return cached
+
+    df = _load_price_data_uncached(symbol, start, end)
+
+    if df is not None and not df.empty:
+        _cache_write(cache_path, df)
+
+    return df
+
+
+def _load_price_data_uncached(symbol: str, start: str, end: str) -> pd.DataFrame:
+
     # ---------------------------------------------------------------
     # Try yfinance first
     # ---------------------------------------------------------------
@@ -140,7 +201,21 @@ def load_price_data(symbol: str, start: str, end: str) -> pd.DataFrame:
 
     if os.path.exists(csv_path):
         try:
-            df = pd.read_csv(csv_path)
+            # Prefer Arrow's multi-threaded C++ CSV reader when
+            # available; fall back to pandas otherwise
+            if pacsv is not None:
+                table = pacsv.read_csv(
+                    csv_path,
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={
+                            "Date": pa.timestamp("ns"),
+                            "Close": pa.float64(),
+                        }
+                    ),
+                )
+                df = table.to_pandas()
+            else:
+                df = pd.read_csv(csv_path)
 
             if "Date" in df.columns:
                 df["Date"] = pd.to_datetime(df["Date"])
@@ -4,12 +4,24 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+# None of our records use caller/thread/process info, so skip the
+# sys._getframe walk and per-record os lookups the logging module
+# performs by default — they dominate emission cost in tight loops.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+
 def setup_logger(name: str, log_dir="logs"):
     Path(log_dir).mkdir(exist_ok=True)
 
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
+    # Records go to our file handler only; skip the root-logger walk
+    logger.propagate = False
+
     # Do not add duplicate handlers if logger already initialized
     if logger.handlers:
         return logger
@@ -26,8 +38,11 @@ def setup_logger(name: str, log_dir="logs"):
         encoding="utf-8"
     )
 
+    # Fixed datefmt avoids the default asctime path, which formats the
+    # timestamp twice (strftime + msec interpolation) per record
     formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s"
+        "%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%S"
     )
     handler.setFormatter(formatter)
 
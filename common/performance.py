@@ -11,13 +11,99 @@
 #   - Sortino Ratio
 #
 # All functions are indentation-safe and human-readable.
+#
+# compute_performance converts the equity series to one contiguous
+# float64 array and derives every metric from shared returns /
+# running-max arrays, instead of re-scanning the Series per metric.
 # ======================================================================
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
+# ----------------------------------------------------------------------
+# Result caches for the ratio helpers, keyed on a content hash of the
+# equity bytes + risk-free rate. Walk-forward and parameter sweeps call
+# these repeatedly on identical slices; a hit skips the whole
+# returns/std computation. Bounded LRU-style via OrderedDict.
+# ----------------------------------------------------------------------
+_RATIO_CACHE_MAXSIZE = 1024
+_SHARPE_CACHE: OrderedDict = OrderedDict()
+_SORTINO_CACHE: OrderedDict = OrderedDict()
+
+
+def _cache_lookup(cache: OrderedDict, key):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_store(cache: OrderedDict, key, value) -> None:
+    cache[key] = value
+    if len(cache) > _RATIO_CACHE_MAXSIZE:
+        cache.popitem(last=False)
+
+
+def clear_ratio_caches() -> None:
+    """
+    Drop all memoized Sharpe/Sortino results.
+    """
+    _SHARPE_CACHE.clear()
+    _SORTINO_CACHE.clear()
+
+
+# ----------------------------------------------------------------------
+# Shared helpers on precomputed returns arrays
+# ----------------------------------------------------------------------
+def _sharpe_from_returns(
+    returns: np.ndarray,
+    risk_free_rate: float = 0.0
+) -> float:
+    """
+    Annualized Sharpe ratio from a daily-returns array.
+    """
+
+    if returns.size == 0:
+        return 0.0
+
+    std = returns.std(ddof=1)
+
+    if std == 0 or np.isnan(std):
+        return 0.0
+
+    daily_rf = risk_free_rate / 252.0
+    sharpe = (returns.mean() - daily_rf) / std
+
+    return float(np.sqrt(252) * sharpe)
+
+
+def _sortino_from_returns(
+    returns: np.ndarray,
+    risk_free_rate: float = 0.0
+) -> float:
+    """
+    Annualized Sortino ratio from a daily-returns array.
+    """
+
+    downside = returns[returns < 0]
+
+    if downside.size == 0:
+        return 0.0
+
+    downside_std = downside.std(ddof=1)
+
+    if downside_std == 0:
+        return 0.0
+
+    daily_rf = risk_free_rate / 252.0
+    sortino = (returns.mean() - daily_rf) / downside_std
+
+    return float(np.sqrt(252) * sortino)
+
 
 # ----------------------------------------------------------------------
 # Sharpe Ratio
@@ -28,17 +114,23 @@ def compute_sharpe_ratio(
 ) -> float:
     """
     Computes the annualized Sharpe ratio using daily returns.
+    Results are memoized on a content hash of the equity values.
     """
 
-    returns = equity.pct_change().dropna()
+    values = equity.to_numpy(dtype=np.float64)
+    key = (hash(values.tobytes()), risk_free_rate)
 
-    if returns.empty or returns.std() == 0:
-        return 0.0
+    cached = _cache_lookup(_SHARPE_CACHE, key)
+    if cached is not None:
+        return cached
 
-    daily_rf = risk_free_rate / 252.0
-    sharpe = (returns.mean() - daily_rf) / returns.std()
+    # Drop NaN returns from gap bars, as pct_change().dropna() did
+    returns = np.diff(values) / values[:-1]
+    returns = returns[~np.isnan(returns)]
+    result = _sharpe_from_returns(returns, risk_free_rate)
 
-    return float(np.sqrt(252) * sharpe)
+    _cache_store(_SHARPE_CACHE, key, result)
+    return result
 
 
 # ----------------------------------------------------------------------
@@ -50,18 +142,23 @@ def compute_sortino_ratio(
 ) -> float:
     """
     Computes the annualized Sortino ratio using downside deviation.
+    Results are memoized on a content hash of the equity values.
     """
 
-    returns = equity.pct_change().dropna()
-    downside = returns[returns < 0]
+    values = equity.to_numpy(dtype=np.float64)
+    key = (hash(values.tobytes()), risk_free_rate)
 
-    if downside.empty or downside.std() == 0:
-        return 0.0
+    cached = _cache_lookup(_SORTINO_CACHE, key)
+    if cached is not None:
+        return cached
 
-    daily_rf = risk_free_rate / 252.0
-    sortino = (returns.mean() - daily_rf) / downside.std()
+    # Drop NaN returns from gap bars, as pct_change().dropna() did
+    returns = np.diff(values) / values[:-1]
+    returns = returns[~np.isnan(returns)]
+    result = _sortino_from_returns(returns, risk_free_rate)
 
-    return float(np.sqrt(252) * sortino)
+    _cache_store(_SORTINO_CACHE, key, result)
+    return result
 
 
 # ----------------------------------------------------------------------
@@ -73,56 +170,62 @@ def compute_performance(df: pd.DataFrame) -> dict:
     Expects 'equity' and 'position_size' columns to exist.
     """
 
-    equity = df["equity"]
+    eq = np.ascontiguousarray(df["equity"].to_numpy(dtype=np.float64))
+
+    # --------------------------------------------------------------
+    # Shared arrays: daily returns and running maximum
+    # --------------------------------------------------------------
+    # NaN equity bars (a gap bar marked to a NaN price) must not
+    # poison the reductions below: drop NaN returns the way the old
+    # pct_change().dropna() did, and accumulate the running max with
+    # fmax, which skips NaN like cummax
+    ret = np.diff(eq) / eq[:-1]
+    ret = ret[~np.isnan(ret)]
+    rolling_max = np.fmax.accumulate(eq)
 
     # --------------------------------------------------------------
     # Total Return
     # --------------------------------------------------------------
-    total_return = (equity.iloc[-1] / equity.iloc[0]) - 1.0
+    total_return = (eq[-1] / eq[0]) - 1.0
 
     # --------------------------------------------------------------
     # Max Drawdown
     # --------------------------------------------------------------
-    rolling_max = equity.cummax()
-    drawdown = (equity - rolling_max) / rolling_max
-    max_drawdown = drawdown.min()
+    drawdown = (eq - rolling_max) / rolling_max
+    max_drawdown = np.nanmin(drawdown)
 
     # --------------------------------------------------------------
     # Number of Trades
     # --------------------------------------------------------------
-    position_changes = df["position_size"].diff().fillna(0)
-    trade_entries = (position_changes > 0).sum()
-    trade_exits = (position_changes < 0).sum()
-    num_trades = int(min(trade_entries, trade_exits))
+    pos = df["position_size"].to_numpy(dtype=np.float64)
+    position_changes = np.diff(pos, prepend=pos[0])
+    trade_entries = int(np.count_nonzero(position_changes > 0))
+    trade_exits = int(np.count_nonzero(position_changes < 0))
+    num_trades = min(trade_entries, trade_exits)
 
     # --------------------------------------------------------------
     # Win Rate (based on equity increases)
     # --------------------------------------------------------------
-    wins = 0
-    losses = 0
-    prev_equity = equity.iloc[0]
-
-    for val in equity:
-        if val > prev_equity:
-            wins += 1
-        elif val < prev_equity:
-            losses += 1
-        prev_equity = val
+    # count_nonzero on the comparison masks is a branchless popcount
+    # over the sign of each return — no Python-level loop, no
+    # intermediate reduction over a bool Series
+    wins = int(np.count_nonzero(ret > 0))
+    losses = int(np.count_nonzero(ret < 0))
 
     win_rate = wins / (wins + losses) if (wins + losses) > 0 else 0.0
 
     # --------------------------------------------------------------
-    # Risk-Adjusted Metrics
+    # Risk-Adjusted Metrics (reuse the returns array)
     # --------------------------------------------------------------
-    sharpe = compute_sharpe_ratio(equity)
-    sortino = compute_sortino_ratio(equity)
+    sharpe = _sharpe_from_returns(ret)
+    sortino = _sortino_from_returns(ret)
 
     # --------------------------------------------------------------
     # Return all metrics
     # --------------------------------------------------------------
     return {
-        "total_return": total_return,
-        "max_drawdown": max_drawdown,
+        "total_return": float(total_return),
+        "max_drawdown": float(max_drawdown),
         "num_trades": num_trades,
         "win_rate": win_rate,
         "sharpe": sharpe,
@@ -2,34 +2,92 @@
 #
 # Writes trade history to a CSV file for later analysis.
 #
+# The file handle is opened once and kept for the lifetime of the
+# logger; rows accumulate in the write buffer and are flushed every
+# FLUSH_EVERY_ROWS rows or FLUSH_INTERVAL_S seconds, whichever comes
+# first. This amortizes the open/write/close syscall cost that a
+# per-trade open would pay on every event.
+#
 
+import atexit
 import csv
+import time
 from pathlib import Path
-from datetime import datetime
+from time import monotonic
 
 
 class TradeLogger:
 
+    FLUSH_EVERY_ROWS = 64
+    FLUSH_INTERVAL_S = 0.25
+
     def __init__(self, path="logs/trades.csv"):
         self.path = Path(path)
 
         # Create logs directory + file header if needed
-        if not self.path.exists():
+        write_header = not self.path.exists()
+        if write_header:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["timestamp", "action", "price", "pnl", "total_pnl"])
+
+        self._fh = open(self.path, "a", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._fh)
+        self._pending = 0
+        self._last_flush = monotonic()
+
+        # Seconds-string cache: the ISO prefix only changes once per
+        # second, so format it once and append nanoseconds per row
+        self._last_sec = 0
+        self._last_sec_str = ""
+
+        if write_header:
+            self._writer.writerow(
+                ["timestamp", "action", "price", "pnl", "total_pnl"]
+            )
+            self._fh.flush()
+
+        atexit.register(self.close)
 
     def write(self, action, price, pnl, total_pnl):
         """
         Append a single trade event to the CSV log.
+        Rows are buffered; see class-level flush policy.
+        """
+        sec, rem = divmod(time.time_ns(), 1_000_000_000)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_sec_str = time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.gmtime(sec)
+            )
+
+        self._writer.writerow([
+            f"{self._last_sec_str}.{rem:09d}Z",
+            action,
+            f"{price:.4f}",
+            f"{pnl:.4f}" if pnl is not None else "",
+            f"{total_pnl:.4f}"
+        ])
+        self._pending += 1
+
+        now = monotonic()
+        if (
+            self._pending >= self.FLUSH_EVERY_ROWS
+            or (now - self._last_flush) > self.FLUSH_INTERVAL_S
+        ):
+            self.flush()
+
+    def flush(self):
+        """
+        Push buffered rows out to the OS.
+        """
+        if not self._fh.closed:
+            self._fh.flush()
+        self._pending = 0
+        self._last_flush = monotonic()
+
+    def close(self):
+        """
+        Flush and close the underlying file. Safe to call twice.
         """
-        with open(self.path, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                datetime.utcnow().isoformat(),
-                action,
-                f"{price:.4f}",
-                f"{pnl:.4f}" if pnl is not None else "",
-                f"{total_pnl:.4f}"
-            ])
+        if not self._fh.closed:
+            self._fh.flush()
+            self._fh.close()
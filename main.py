@@ -20,9 +20,10 @@ from __future__ import annotations
 # Standard library imports
 # ----------------------------------------------------------------------
 import os
-import csv
 from datetime import datetime, timezone
 
+import pandas as pd
+
 # ----------------------------------------------------------------------
 # Project imports
 # ----------------------------------------------------------------------
@@ -132,11 +133,9 @@ def run_engine() -> None:
 
     write_header = not os.path.exists(summary_path)
 
-    with open(summary_path, mode="a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=summary_row.keys())
-        if write_header:
-            writer.writeheader()
-        writer.writerow(summary_row)
+    pd.DataFrame([summary_row]).to_csv(
+        summary_path, mode="a", header=write_header, index=False
+    )
 
     print(f"\nBacktest summary appended to {summary_path}")
 
@@ -1,33 +1,53 @@
 # polygon_bot/client.py
 
-import random
 import time
 
+import numpy as np
+
 class PolygonClient:
     """
     Mock Polygon client for demo/testing.
     Produces synthetic token price + block height.
+
+    Price deltas and volumes are drawn in bulk from a NumPy generator
+    and served from a cursor, matching BinanceClient, so tight
+    simulation loops avoid per-call random.uniform overhead.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, prefill: int = 4096):
         self.config = config
         self.token = config.get("token_address", "MATIC")
         self._price = 1.20
         self._block = 50000000
 
+        self._prefill = prefill
+        self._rng = np.random.default_rng()
+        self._refill()
+
+    def _refill(self):
+        self._deltas = self._rng.uniform(-0.02, 0.02, self._prefill)
+        self._vols = self._rng.uniform(500, 2000, self._prefill)
+        self._cursor = 0
+
     def get_market_data(self):
+        if self._cursor == self._prefill:
+            self._refill()
+
         # Simulate block progression
         self._block += 1
 
         # Simulate token price movement
-        delta = random.uniform(-0.02, 0.02)
-        self._price = max(0.01, self._price + delta)
+        delta = self._deltas[self._cursor]
+        volume = self._vols[self._cursor]
+        self._cursor += 1
+
+        self._price = max(0.01, self._price + float(delta))
 
         return {
             "token": self.token,
             "latest_block": self._block,
             "price": round(self._price, 4),
-            "volume": random.uniform(500, 2000),
+            "volume": float(volume),
             "timestamp": time.time(),
         }
 
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+
+from common._njit import njit
+
+
+@njit(cache=True)
+def replay_fsm(
+    close,
+    codes,
+    sizing_enabled,
+    risk_amount,
+    stop_loss_pct,
+    balance,
+):
+    """
+    Sequential long-only position state machine over int8 signal codes
+    (BUY=1, SELL=-1, HOLD=0), mirroring PaperBroker fill rules: a BUY
+    fills only while flat and only if cost fits the running balance;
+    a SELL fills only while long.
+
+    Compiled with numba when available; the loop is loop-carried
+    (position and balance feed forward), so it cannot be expressed as
+    pure NumPy ufuncs.
+
+    Returns (fill_idx, fill_side, fill_qty, count, final_balance):
+    parallel arrays of bar index, side code and quantity per fill,
+    valid up to count.
+    """
+    n = codes.size
+    fill_idx = np.empty(n, dtype=np.int64)
+    fill_side = np.empty(n, dtype=np.int8)
+    fill_qty = np.empty(n, dtype=np.float64)
+
+    count = 0
+    position = 0.0
+
+    for i in range(n):
+        code = codes[i]
+
+        if code == 0:
+            continue
+
+        price = close[i]
+
+        if code == 1 and position == 0.0:
+            if sizing_enabled:
+                stop_distance = price * stop_loss_pct
+                if stop_distance <= 0:
+                    qty = 1.0
+                else:
+                    qty = max(float(int(risk_amount / stop_distance)), 1.0)
+            else:
+                qty = 1.0
+
+            cost = qty * price
+            if price > 0 and cost <= balance:
+                balance -= cost
+                position = qty
+                fill_idx[count] = i
+                fill_side[count] = 1
+                fill_qty[count] = qty
+                count += 1
+
+        elif code == -1 and position > 0.0 and price > 0:
+            balance += position * price
+            fill_idx[count] = i
+            fill_side[count] = -1
+            fill_qty[count] = position
+            count += 1
+            position = 0.0
+
+    return fill_idx, fill_side, fill_qty, count, balance
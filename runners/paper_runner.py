@@ -1,51 +1,70 @@
 from __future__ import annotations
 
+import numpy as np
+
 from brokers.paper import PaperBroker
 from brokers.base import OrderRequest
-from strategies.macd_strategy import MACDStrategy
+from runners._fsm import replay_fsm
 
 
 def run_paper(symbol: str, df, config):
     """
     Runs the MACD strategy using the PaperBroker.
     Executes orders via the broker instead of direct balance math.
+
+    The position state machine runs in replay_fsm (numba-compiled when
+    available) over raw Close/signal arrays; only the resulting fills
+    — a tiny subset of bars — touch the broker from Python.
     """
 
-    broker = PaperBroker(
-        starting_balance=config["strategy"]["backtest"]["initial_capital"]
-    )
+    initial_capital = config["strategy"]["backtest"]["initial_capital"]
+    broker = PaperBroker(starting_balance=initial_capital)
 
-    strategy = MACDStrategy(config)
+    if "signal_code" in df.columns:
+        codes = df["signal_code"].to_numpy(dtype=np.int8)
+    elif "signal_flag" in df.columns:
+        # Back-compat for frames carrying the old string column
+        flags = df["signal_flag"].to_numpy()
+        codes = np.where(
+            flags == "BUY", 1, np.where(flags == "SELL", -1, 0)
+        ).astype(np.int8)
+    else:
+        return broker.get_balance()
 
-    position = 0.0
+    close = df["Close"].to_numpy(dtype=np.float64)
 
-    for index, row in df.iterrows():
-        price = float(row["Close"])
-        broker.set_last_price(symbol, price)
+    ps = config["strategy"]["position_sizing"]
 
-        signal = row.get("signal_flag", "HOLD")
+    fill_idx, fill_side, fill_qty, count, _ = replay_fsm(
+        close,
+        codes,
+        bool(ps["enabled"]),
+        float(ps["account_balance"]) * float(ps["risk_per_trade"]),
+        float(ps["stop_loss_pct"]),
+        float(initial_capital),
+    )
 
-        if signal == "BUY" and position == 0:
-            qty = strategy.calculate_position_size(price)
-            result = broker.place_order(
-                OrderRequest(
-                    symbol=symbol,
-                    side="BUY",
-                    quantity=qty,
-                )
-            )
-            if result.status == "FILLED":
-                position = qty
-
-        elif signal == "SELL" and position > 0:
-            result = broker.place_order(
-                OrderRequest(
-                    symbol=symbol,
-                    side="SELL",
-                    quantity=position,
-                )
+    # Replay the fills in order through the broker. tolist() yields
+    # native Python floats in one C pass, so no per-fill float() casts
+    fill_prices = close[fill_idx[:count]].tolist()
+    fill_qtys = fill_qty[:count].tolist()
+    last_set = None
+    for k in range(count):
+        price = fill_prices[k]
+        if price != last_set:
+            broker.set_last_price(symbol, price)
+            last_set = price
+        result = broker.place_order(
+            OrderRequest(
+                symbol=symbol,
+                side="BUY" if fill_side[k] == 1 else "SELL",
+                quantity=fill_qtys[k],
             )
-            if result.status == "FILLED":
-                position = 0.0
+        )
+        if result.status != "FILLED":
+            # The broker disagreed with the kernel's fill assumption;
+            # every later fill was simulated from a position/balance
+            # the broker does not have, so stop replaying here
+            break
 
     return broker.get_balance()
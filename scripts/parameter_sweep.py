@@ -15,7 +15,8 @@
 
 import sys
 import os
-import copy
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 
 # ----------------------------------------------------------------------
 # Ensure project root is on PYTHONPATH
@@ -37,6 +38,60 @@ from strategies.macd_strategy import MACDStrategy
 from common.performance import compute_performance
 
 
+# ----------------------------------------------------------------------
+# Worker-process state, broadcast once via the pool initializer so the
+# price data and base config are not re-pickled for every grid cell
+# ----------------------------------------------------------------------
+_worker_df = None
+_worker_config = None
+
+
+def _init_worker(df_inputs, base_config):
+    global _worker_df, _worker_config
+    _worker_df = df_inputs
+    _worker_config = base_config
+
+
+def _run_one(pair):
+    """
+    Run one (buy, sell) grid cell and return its result row.
+    """
+    buy, sell = pair
+
+    # Rebind only the subdicts this run touches; everything else is
+    # shared by reference (the strategy only reads the config), which
+    # avoids deep-walking the whole tree per grid cell
+    base_strategy = _worker_config["strategy"]
+    cfg = {
+        **_worker_config,
+        "strategy": {
+            **base_strategy,
+            "thresholds": {
+                **base_strategy["thresholds"],
+                "normalized_buy": buy,
+                "normalized_sell": sell,
+            },
+            "log_trades": False,
+        },
+    }
+
+    # Indicators were precomputed once in main(); only the threshold
+    # logic and backtest run per cell
+    strategy = MACDStrategy(cfg)
+    df_result = strategy.apply_thresholds(_worker_df.copy(), buy, sell)
+
+    metrics = compute_performance(df_result)
+
+    return {
+        "buy_threshold": buy,
+        "sell_threshold": sell,
+        "total_return": float(metrics["total_return"]),
+        "max_drawdown": float(metrics["max_drawdown"]),
+        "num_trades": int(metrics["num_trades"]),
+        "win_rate": float(metrics["win_rate"]),
+    }
+
+
 def main():
     """
     Entry point for parameter sweep.
@@ -61,6 +116,14 @@ def main():
         print("ERROR: No price data available. Aborting sweep.")
         return
 
+    # The strategy only reads Close and writes its own columns, so
+    # each run needs a copy of that one column — not the whole frame.
+    # The MACD/normalized-MACD series are threshold-independent, so
+    # compute them once here; the grid cells only re-apply thresholds.
+    df_inputs = MACDStrategy(base_config).compute_indicators(
+        df_price[["Close"]].copy()
+    )
+
     # --------------------------------------------------------------
     # Parameter ranges to test
     # Adjust these values to widen or narrow the search
@@ -68,49 +131,28 @@ def main():
     buy_levels = [-0.80, -0.70, -0.60]
     sell_levels = [0.60, 0.70, 0.80]
 
-    results = []
+    # Sanity check: BUY threshold must be below SELL threshold
+    pairs = [
+        (buy, sell)
+        for buy in buy_levels
+        for sell in sell_levels
+        if buy < sell
+    ]
 
     # --------------------------------------------------------------
-    # Grid search loop
+    # Grid search — each (buy, sell) cell is fully independent, so
+    # fan the cells out across cores
     # --------------------------------------------------------------
-    for buy in buy_levels:
-        for sell in sell_levels:
-
-            # Sanity check: BUY threshold must be below SELL threshold
-            if buy >= sell:
-                continue
-
-            # Deep copy config so each run is isolated
-            cfg = copy.deepcopy(base_config)
-            cfg["strategy"]["thresholds"]["normalized_buy"] = buy
-            cfg["strategy"]["thresholds"]["normalized_sell"] = sell
-            cfg["strategy"]["log_trades"] = False
-
-
-            # Run strategy
-            strategy = MACDStrategy(cfg)
-            df_result = strategy.run(df_price.copy())
-
-            # Compute performance metrics
-            metrics = compute_performance(df_result)
-
-            results.append({
-                "buy_threshold": buy,
-                "sell_threshold": sell,
-                "total_return": float(metrics["total_return"]),
-                "max_drawdown": float(metrics["max_drawdown"]),
-                "num_trades": int(metrics["num_trades"]),
-                "win_rate": float(metrics["win_rate"]),
-            })
+    with ProcessPoolExecutor(
+        initializer=_init_worker,
+        initargs=(df_inputs, base_config),
+    ) as executor:
+        results = list(executor.map(_run_one, pairs))
 
     # --------------------------------------------------------------
     # Sort results by total return (descending)
     # --------------------------------------------------------------
-    results = sorted(
-        results,
-        key=lambda x: x["total_return"],
-        reverse=True
-    )
+    results.sort(key=itemgetter("total_return"), reverse=True)
 
     # --------------------------------------------------------------
     # Display results
@@ -16,10 +16,12 @@
 
 from __future__ import annotations
 
+import copy
+import csv
 import os
 import sys
-from datetime import timedelta
 
+import numpy as np
 import pandas as pd
 
 # ----------------------------------------------------------------------
@@ -69,41 +71,83 @@ def walk_forward(
 
     df_all = df_all.sort_index()
     dates = df_all.index
+    # Sorted index lets window slicing use binary search instead of
+    # materializing full boolean masks per window
+    idx_values = dates.values
 
     print(f"Walk-forward on {symbol}")
     print(f"Data range: {dates[0].date()} → {dates[-1].date()}")
     print("-" * 70)
 
-    results = []
-    i = 0
+    # Parse the YAML once; windows get their own deep copy to mutate
+    cfg_template = load_config("configs/example_config.yaml")
+
+    # ----------------------------------------------------------
+    # Precompute the full window schedule in one vectorized pass:
+    # start positions stride the index by test_days, boundaries come
+    # from datetime64 arithmetic, and warm-up/test slice bounds are
+    # resolved with a batched searchsorted
+    # ----------------------------------------------------------
+    train_td = np.timedelta64(train_days, "D")
+    test_td = np.timedelta64(test_days, "D")
+    warmup_td = np.timedelta64(warmup_days, "D")
+
+    train_starts = idx_values[np.arange(0, len(dates), test_days)]
+    test_starts = train_starts + train_td
+    test_ends = test_starts + test_td
+
+    # Windows are valid while they fit inside the history; starts are
+    # monotonic, so the valid set is a prefix
+    n_windows = int(np.count_nonzero(test_ends <= idx_values[-1]))
+
+    warmup_los = np.searchsorted(
+        idx_values, test_starts - warmup_td, side="left"
+    )
+    window_his = np.searchsorted(idx_values, test_ends, side="left")
 
-    while True:
-        # ----------------------------------------------------------
-        # Define rolling window boundaries
-        # ----------------------------------------------------------
-        train_start = dates[i]
-        train_end = train_start + timedelta(days=train_days)
+    if n_windows == 0:
+        print("No walk-forward windows were evaluated.")
+        return
 
-        test_start = train_end
-        test_end = test_start + timedelta(days=test_days)
+    # ----------------------------------------------------------
+    # Stream each window's row to the CSV as it finishes, so long
+    # runs keep constant memory and a crash preserves partial
+    # results. The summary comes from running aggregates.
+    # ----------------------------------------------------------
+    fieldnames = [
+        "train_start", "train_end", "test_start", "test_end",
+        "return_pct", "max_dd_pct", "trades", "win_rate_pct",
+        "sharpe", "sortino",
+    ]
+
+    out_file = open("walk_forward_results.csv", "w", newline="")
+    # LF rows, matching the pandas-written file this replaced
+    writer = csv.DictWriter(
+        out_file, fieldnames=fieldnames, lineterminator="\n"
+    )
+    writer.writeheader()
 
-        if test_end > dates[-1]:
-            break
+    sum_return = 0.0
+    min_return = float("inf")
+    sum_dd = 0.0
+    sum_sharpe = 0.0
+    sum_sortino = 0.0
+
+    for w in range(n_windows):
+        train_start = pd.Timestamp(train_starts[w])
+        train_end = pd.Timestamp(test_starts[w])
+        test_start = train_end
+        test_end = pd.Timestamp(test_ends[w])
 
         # ----------------------------------------------------------
         # Prepare warm-up + test data
         # ----------------------------------------------------------
-        warmup_start = test_start - timedelta(days=warmup_days)
-
-        test_df = df_all.loc[
-            (df_all.index >= warmup_start) &
-            (df_all.index < test_end)
-        ].copy()
+        test_df = df_all.iloc[warmup_los[w]:window_his[w]].copy()
 
         # ----------------------------------------------------------
-        # Load config and force walk-forward-safe parameters
+        # Copy config and force walk-forward-safe parameters
         # ----------------------------------------------------------
-        cfg = load_config("configs/example_config.yaml")
+        cfg = copy.deepcopy(cfg_template)
 
         # Disable trade logging during sweeps
         cfg["strategy"]["log_trades"] = False
@@ -136,10 +180,10 @@ def walk_forward(
         out = strategy.run(test_df)
 
         # Keep only the real test window (exclude warm-up)
-        out = out.loc[
-            (out.index >= test_start) &
-            (out.index < test_end)
-        ]
+        out_values = out.index.values
+        t_lo = np.searchsorted(out_values, np.datetime64(test_start), side="left")
+        t_hi = np.searchsorted(out_values, np.datetime64(test_end), side="left")
+        out = out.iloc[t_lo:t_hi]
 
         # ----------------------------------------------------------
         # Diagnostics
@@ -147,16 +191,17 @@ def walk_forward(
         equity_start = float(out["equity"].iloc[0])
         equity_end = float(out["equity"].iloc[-1])
 
-        signal_counts = out["signal_flag"].value_counts(
-            dropna=False
-        ).to_dict()
+        code_labels = {1: "BUY", -1: "SELL", 0: "HOLD"}
+        codes, counts = np.unique(
+            out["signal_code"].to_numpy(), return_counts=True
+        )
+        signal_counts = {
+            code_labels[c]: n for c, n in zip(codes.tolist(), counts.tolist())
+        }
 
+        pos = out["position_size"].to_numpy(dtype=np.float64)
         position_changes = int(
-            out["position_size"]
-            .diff()
-            .fillna(0)
-            .abs()
-            .sum()
+            np.abs(np.diff(pos, prepend=pos[0])).sum()
         )
 
         print(f"  Equity: {equity_start:.2f} → {equity_end:.2f}")
@@ -184,29 +229,28 @@ def walk_forward(
         print("  Performance:", window_result)
         print("-" * 70)
 
-        results.append(window_result)
+        writer.writerow(window_result)
+        out_file.flush()
+
+        sum_return += window_result["return_pct"]
+        min_return = min(min_return, window_result["return_pct"])
+        sum_dd += window_result["max_dd_pct"]
+        sum_sharpe += window_result["sharpe"]
+        sum_sortino += window_result["sortino"]
 
-        # Advance by test window length
-        i += test_days
+    out_file.close()
 
     # --------------------------------------------------------------
-    # Aggregate and save walk-forward results
+    # Summary from the streaming aggregates
     # --------------------------------------------------------------
-    if not results:
-        print("No walk-forward windows were evaluated.")
-        return
-
-    wf_df = pd.DataFrame(results)
-    wf_df.to_csv("walk_forward_results.csv", index=False)
-
     print("\nWalk-Forward Summary")
     print("--------------------")
-    print(f"Windows tested : {len(wf_df)}")
-    print(f"Avg Return     : {wf_df['return_pct'].mean():.2f}%")
-    print(f"Worst Return   : {wf_df['return_pct'].min():.2f}%")
-    print(f"Avg Max DD     : {wf_df['max_dd_pct'].mean():.2f}%")
-    print(f"Avg Sharpe     : {wf_df['sharpe'].mean():.2f}")
-    print(f"Avg Sortino    : {wf_df['sortino'].mean():.2f}")
+    print(f"Windows tested : {n_windows}")
+    print(f"Avg Return     : {sum_return / n_windows:.2f}%")
+    print(f"Worst Return   : {min_return:.2f}%")
+    print(f"Avg Max DD     : {sum_dd / n_windows:.2f}%")
+    print(f"Avg Sharpe     : {sum_sharpe / n_windows:.2f}")
+    print(f"Avg Sortino    : {sum_sortino / n_windows:.2f}")
     print("\nSaved walk_forward_results.csv")
 
 
@@ -1,33 +1,53 @@
 # solana_bot/client.py
 
-import random
 import time
 
+import numpy as np
+
 class SolanaClient:
     """
     Mock Solana client for demo/testing.
     Generates synthetic market values + slot numbers.
+
+    Price deltas and volumes are drawn in bulk from a NumPy generator
+    and served from a cursor, matching BinanceClient, so tight
+    simulation loops avoid per-call random.uniform overhead.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, prefill: int = 4096):
         self.config = config
         self.market = config.get("market_address", "SOL/USDC")
         self._price = 95.0
         self._slot = 200000000
 
+        self._prefill = prefill
+        self._rng = np.random.default_rng()
+        self._refill()
+
+    def _refill(self):
+        self._deltas = self._rng.uniform(-0.5, 0.5, self._prefill)
+        self._vols = self._rng.uniform(1000, 5000, self._prefill)
+        self._cursor = 0
+
     def get_market_data(self):
+        if self._cursor == self._prefill:
+            self._refill()
+
         # Simulate slot progression
         self._slot += 1
 
         # Simulate simple market movement
-        delta = random.uniform(-0.5, 0.5)
-        self._price = max(1.0, self._price + delta)
+        delta = self._deltas[self._cursor]
+        volume = self._vols[self._cursor]
+        self._cursor += 1
+
+        self._price = max(1.0, self._price + float(delta))
 
         return {
             "market": self.market,
             "slot": self._slot,
             "price": round(self._price, 3),
-            "volume": random.uniform(1000, 5000),
+            "volume": float(volume),
             "timestamp": time.time(),
         }
 
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import numpy as np
+
+from common._njit import njit, HAVE_NUMBA
+
+
+@njit(cache=True)
+def backtest_kernel(
+    close,
+    codes,
+    init_capital,
+    commission,
+    slippage,
+    sizing_enabled,
+    risk_amount,
+    stop_loss_pct,
+):
+    """
+    Long-only backtest state machine over int8 signal codes (BUY=1,
+    SELL=-1, HOLD=0) with flat commission and percentage slippage,
+    mirroring MACDStrategy.run_backtest fill rules: a BUY fills only
+    while flat and only if cost fits the running capital; a SELL
+    fills only while long.
+
+    Compiled with numba when available; capital and position are
+    loop-carried, so the sweep cannot be expressed as pure ufuncs.
+
+    Returns (position_size, equity, entry_idx, exit_idx, entry_price,
+    exit_price, trade_size, pnl, n_trades): per-bar position/equity
+    arrays plus parallel per-trade arrays valid up to n_trades.
+    """
+    n = close.size
+
+    position_size = np.zeros(n, dtype=np.float64)
+    equity = np.empty(n, dtype=np.float64)
+
+    # Preallocated trade buffer; truncated by the caller via n_trades
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    entry_price = np.empty(n, dtype=np.float64)
+    exit_price = np.empty(n, dtype=np.float64)
+    trade_size = np.empty(n, dtype=np.float64)
+    pnl = np.empty(n, dtype=np.float64)
+
+    capital = init_capital
+    position = 0.0
+    entry_price_eff = 0.0
+    cur_entry = -1
+    n_trades = 0
+
+    for i in range(n):
+        price = close[i]
+        code = codes[i]
+
+        if code == 1 and position == 0.0:
+            if sizing_enabled:
+                stop_distance = price * stop_loss_pct
+                if stop_distance <= 0:
+                    size = 1.0
+                else:
+                    size = max(float(int(risk_amount / stop_distance)), 1.0)
+            else:
+                size = 1.0
+
+            eff = price * (1.0 + slippage)
+            cost = size * eff + commission
+
+            if cost <= capital:
+                capital -= cost
+                position = size
+                entry_price_eff = eff
+                cur_entry = i
+                position_size[i] = size
+
+        elif code == -1 and position > 0.0:
+            eff = price * (1.0 - slippage)
+            capital += position * eff - commission
+
+            entry_idx[n_trades] = cur_entry
+            exit_idx[n_trades] = i
+            entry_price[n_trades] = entry_price_eff
+            exit_price[n_trades] = eff
+            trade_size[n_trades] = position
+            pnl[n_trades] = (
+                (eff - entry_price_eff) * position - 2.0 * commission
+            )
+            n_trades += 1
+            position = 0.0
+
+        # Mark-to-market equity every bar
+        equity[i] = capital + position * price
+
+    return (
+        position_size,
+        equity,
+        entry_idx,
+        exit_idx,
+        entry_price,
+        exit_price,
+        trade_size,
+        pnl,
+        n_trades,
+    )
+
+
+def backtest_sparse(
+    close,
+    codes,
+    init_capital,
+    commission,
+    slippage,
+    sizing_enabled,
+    risk_amount,
+    stop_loss_pct,
+):
+    """
+    Same contract as backtest_kernel, but structured for the
+    interpreter: only bars with a nonzero signal enter the Python
+    loop, and the piecewise-constant cash/position series between
+    fills is expanded afterwards with np.repeat so mark-to-market
+    equity is one vectorized expression. Most bars are HOLD, so this
+    cuts interpreted iterations to the signal count.
+
+    backtest_dispatch picks this path when numba is unavailable; the
+    compiled dense kernel wins otherwise.
+    """
+    n = close.size
+
+    position_size = np.zeros(n, dtype=np.float64)
+
+    events = np.flatnonzero(codes)
+    ev_codes = codes[events].tolist()
+    ev_prices = close[events].tolist()
+    ev_index = events.tolist()
+
+    capital = init_capital
+    position = 0.0
+    entry_price_eff = 0.0
+    cur_entry = -1
+
+    # Segment state for the equity expansion: each fill starts a new
+    # (cash, position) segment at its bar
+    fill_bounds = []
+    cash_vals = [init_capital]
+    pos_vals = [0.0]
+
+    entry_idx = []
+    exit_idx = []
+    entry_price = []
+    exit_price = []
+    trade_size = []
+    pnl = []
+
+    for k in range(len(ev_index)):
+        i = ev_index[k]
+        code = ev_codes[k]
+        price = ev_prices[k]
+
+        if code == 1 and position == 0.0:
+            if sizing_enabled:
+                stop_distance = price * stop_loss_pct
+                if stop_distance <= 0:
+                    size = 1.0
+                else:
+                    size = max(float(int(risk_amount / stop_distance)), 1.0)
+            else:
+                size = 1.0
+
+            eff = price * (1.0 + slippage)
+            cost = size * eff + commission
+
+            if cost <= capital:
+                capital -= cost
+                position = size
+                entry_price_eff = eff
+                cur_entry = i
+                position_size[i] = size
+
+                fill_bounds.append(i)
+                cash_vals.append(capital)
+                pos_vals.append(position)
+
+        elif code == -1 and position > 0.0:
+            eff = price * (1.0 - slippage)
+            capital += position * eff - commission
+
+            entry_idx.append(cur_entry)
+            exit_idx.append(i)
+            entry_price.append(entry_price_eff)
+            exit_price.append(eff)
+            trade_size.append(position)
+            pnl.append((eff - entry_price_eff) * position - 2.0 * commission)
+
+            position = 0.0
+
+            fill_bounds.append(i)
+            cash_vals.append(capital)
+            pos_vals.append(position)
+
+    # Expand the per-segment cash/position values across their bar
+    # ranges and mark to market in one shot
+    bounds = np.concatenate(
+        ([0], np.asarray(fill_bounds, dtype=np.int64), [n])
+    )
+    lengths = np.diff(bounds)
+    cash_arr = np.repeat(np.asarray(cash_vals), lengths)
+    pos_arr = np.repeat(np.asarray(pos_vals), lengths)
+    equity = cash_arr + pos_arr * close
+
+    n_trades = len(pnl)
+
+    return (
+        position_size,
+        equity,
+        np.asarray(entry_idx, dtype=np.int64),
+        np.asarray(exit_idx, dtype=np.int64),
+        np.asarray(entry_price, dtype=np.float64),
+        np.asarray(exit_price, dtype=np.float64),
+        np.asarray(trade_size, dtype=np.float64),
+        np.asarray(pnl, dtype=np.float64),
+        n_trades,
+    )
+
+
+def backtest_dispatch(*args):
+    """
+    Route to the compiled dense kernel when numba is installed, else
+    to the sparse event-loop path.
+    """
+    if HAVE_NUMBA:
+        return backtest_kernel(*args)
+    return backtest_sparse(*args)
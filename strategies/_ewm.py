@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import numpy as np
+
+from common._njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def ewm3(x, a_fast, a_slow, a_sig):
+    """
+    Fused MACD EMA pass: fast EMA, slow EMA, MACD and signal line in
+    one streaming sweep over x, so the input is read once instead of
+    three times. Each recurrence matches ewm(adjust=False).mean():
+    s = a*x[i] + (1-a)*s, seeded with the first observation.
+
+    Returns (ema_fast, ema_slow, macd, signal) in x's dtype.
+    """
+    n = x.size
+    ema_fast = np.empty(n, dtype=x.dtype)
+    ema_slow = np.empty(n, dtype=x.dtype)
+    macd = np.empty(n, dtype=x.dtype)
+    signal = np.empty(n, dtype=x.dtype)
+
+    s_f = x[0]
+    s_s = x[0]
+    m = s_f - s_s
+    s_g = m
+
+    ema_fast[0] = s_f
+    ema_slow[0] = s_s
+    macd[0] = m
+    signal[0] = s_g
+
+    for i in range(1, n):
+        v = x[i]
+        s_f = a_fast * v + (1.0 - a_fast) * s_f
+        s_s = a_slow * v + (1.0 - a_slow) * s_s
+        m = s_f - s_s
+        s_g = a_sig * m + (1.0 - a_sig) * s_g
+
+        ema_fast[i] = s_f
+        ema_slow[i] = s_s
+        macd[i] = m
+        signal[i] = s_g
+
+    return ema_fast, ema_slow, macd, signal
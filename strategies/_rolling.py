@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from common._njit import njit, HAVE_NUMBA
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+@njit(cache=True)
+def _move_min_max_kernel(arr, window):
+    """
+    Fused rolling min and max via two monotonic deques of indices in
+    preallocated ring buffers — O(n) total work versus O(n*window)
+    for a naive rescan. The first window-1 entries are NaN, matching
+    pandas' full-window rolling behaviour.
+    """
+    n = arr.size
+    mn = np.empty(n, dtype=np.float64)
+    mx = np.empty(n, dtype=np.float64)
+    min_q = np.empty(n, dtype=np.int32)
+    max_q = np.empty(n, dtype=np.int32)
+
+    min_head = 0
+    min_tail = 0
+    max_head = 0
+    max_tail = 0
+
+    for i in range(n):
+        v = arr[i]
+
+        while min_tail > min_head and arr[min_q[min_tail - 1]] >= v:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+
+        while max_tail > max_head and arr[max_q[max_tail - 1]] <= v:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+
+        if min_q[min_head] <= i - window:
+            min_head += 1
+        if max_q[max_head] <= i - window:
+            max_head += 1
+
+        if i >= window - 1:
+            mn[i] = arr[min_q[min_head]]
+            mx[i] = arr[max_q[max_head]]
+        else:
+            mn[i] = np.nan
+            mx[i] = np.nan
+
+    return mn, mx
+
+
+def move_min_max(arr, window: int):
+    """
+    Rolling min and max of a float64 array over a full window.
+
+    Dispatches to Bottleneck's C implementation when installed, then
+    to the numba deque kernel, then to pandas rolling. All paths
+    return NaN for the first window-1 entries.
+    """
+    if bn is not None:
+        return bn.move_min(arr, window), bn.move_max(arr, window)
+
+    if HAVE_NUMBA:
+        return _move_min_max_kernel(arr, window)
+
+    rolling = pd.Series(arr).rolling(window)
+    return rolling.min().to_numpy(), rolling.max().to_numpy()
@@ -17,8 +17,86 @@
 
 from __future__ import annotations
 
+import csv
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+from common._njit import HAVE_NUMBA
+from strategies._backtest import backtest_dispatch
+from strategies._ewm import ewm3
+from strategies._rolling import move_min_max
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+
+def _ewm_mean(arr: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    ewm(adjust=False).mean() with smoothing factor alpha over a
+    plain ndarray.
+
+    Dispatches to scipy.signal.lfilter when SciPy is installed — the
+    same recurrence without pandas object construction — and falls
+    back to pandas otherwise. Seeding zi with x[0]*(1-alpha) makes
+    lfilter reproduce the ewm initialization exactly.
+    """
+    if lfilter is not None:
+        ema, _ = lfilter(
+            [alpha],
+            [1.0, -(1.0 - alpha)],
+            arr,
+            zi=[arr[0] * (1.0 - alpha)],
+        )
+        return ema
+
+    return pd.Series(arr).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+# ----------------------------------------------------------------------
+# Worker-process state for run_many, broadcast once via the pool
+# initializer so the price frame is not re-pickled for every config
+# (same pattern as scripts/parameter_sweep.py)
+# ----------------------------------------------------------------------
+_run_many_df = None
+_run_many_shared = False
+
+
+def _init_run_many_worker(df, shared_indicators):
+    global _run_many_df, _run_many_shared
+    _run_many_df = df
+    _run_many_shared = shared_indicators
+
+    if HAVE_NUMBA:
+        # One process per core already; keep numba single-threaded so
+        # workers do not oversubscribe each other
+        import numba
+        numba.set_num_threads(1)
+
+
+def _run_many_one(config):
+    # All workers share a cwd, so per-worker trade logging would have
+    # them truncating each other's trade_log.csv mid-run; force it off
+    # here (shallow clone, as in scripts/parameter_sweep.py). Callers
+    # that want trades should log from a serial run.
+    config = {
+        **config,
+        "strategy": {**config["strategy"], "log_trades": False},
+    }
+
+    strategy = MACDStrategy(config)
+    frame = _run_many_df.copy()
+
+    if _run_many_shared:
+        # Indicators were precomputed once in the parent
+        frame = strategy.generate_signals(frame)
+        return strategy.run_backtest(frame)
+
+    return strategy.run(frame)
+
 
 class MACDStrategy:
     """
@@ -37,6 +115,73 @@ class MACDStrategy:
     def __init__(self, config: dict) -> None:
         self.config = config
 
+        # Trades from the most recent run_backtest call, for callers
+        # that want them without reading trade_log.csv
+        self.last_trades: list = []
+
+        # Single-slot cache of the last computed EMA arrays, so
+        # repeated run() calls over the same frame (sweeps that vary
+        # only thresholds) skip the EMA passes entirely
+        self._macd_cache: tuple | None = None
+
+        # Streaming trade-log writer, opened lazily on the first
+        # logged trade and reused across run_backtest calls
+        self._trade_fh = None
+        self._trade_writer = None
+
+        self._precompute_config()
+
+    def _log_trades(self, trades: list) -> None:
+        """
+        Appends trade rows to trade_log.csv through a writer that
+        stays open on the instance, so repeated backtest calls
+        (walk-forward folds, long sessions) stream new trades in
+        O(new trades) instead of re-serializing the whole log.
+        """
+        if self._trade_writer is None:
+            self._trade_fh = open("trade_log.csv", "w", newline="")
+            # LF rows, matching the pandas-written file this replaced
+            self._trade_writer = csv.DictWriter(
+                self._trade_fh,
+                fieldnames=trades[0].keys(),
+                lineterminator="\n",
+            )
+            self._trade_writer.writeheader()
+            print("Trade log saved as trade_log.csv")
+
+        self._trade_writer.writerows(trades)
+        self._trade_fh.flush()
+
+    def close_trade_log(self) -> None:
+        """
+        Closes the streaming trade-log file, if one was opened.
+        """
+        if self._trade_fh is not None:
+            self._trade_fh.close()
+            self._trade_fh = None
+            self._trade_writer = None
+
+    def _precompute_config(self) -> None:
+        """
+        Hoists position-sizing settings into scalar attributes so the
+        hot paths never walk the config dict. Called from __init__
+        and again at the top of run() in case the caller mutated the
+        config in between.
+        """
+        ps = self.config["strategy"]["position_sizing"]
+
+        self._ps_enabled = bool(ps["enabled"])
+        self._risk_amount = float(ps["account_balance"]) * float(
+            ps["risk_per_trade"]
+        )
+        self._stop_pct = float(ps["stop_loss_pct"])
+
+        macd_cfg = self.config["strategy"]["macd"]
+
+        self._a_fast = 2.0 / (macd_cfg["fast_period"] + 1.0)
+        self._a_slow = 2.0 / (macd_cfg["slow_period"] + 1.0)
+        self._a_sig = 2.0 / (macd_cfg["signal_period"] + 1.0)
+
     # ------------------------------------------------------------------
     # Compute MACD and signal line
     # ------------------------------------------------------------------
@@ -47,23 +192,56 @@ class MACDStrategy:
         slow = macd_cfg["slow_period"]
         signal_period = macd_cfg["signal_period"]
 
-        # Exponential moving averages
-        df.loc[:, "ema_fast"] = df["Close"].ewm(
-            span=fast,
-            adjust=False
-        ).mean()
+        # Exponential moving averages over a float32 view — halves
+        # the bytes streamed per EMA pass; MACD tolerances are far
+        # above float32 precision
+        close = df["Close"].to_numpy(dtype=np.float32)
+
+        # The recursive paths (ewm3, lfilter) carry a NaN forward for
+        # the rest of the series, unlike pandas ewm which skips
+        # missing values — one bad row coerced to NaN would zero out
+        # every indicator downstream. Forward-fill gaps before
+        # filtering; the bfill covers leading NaNs.
+        if np.isnan(close).any():
+            close = pd.Series(close).ffill().bfill().to_numpy(
+                dtype=np.float32
+            )
+
+        # Reuse the previous EMA arrays when the same prices and
+        # parameters come back. Keyed on a content hash of the Close
+        # buffer (same scheme as common/performance.py) so in-place
+        # mutation or a recycled frame id cannot serve stale arrays.
+        key = (hash(close.tobytes()), fast, slow, signal_period)
+
+        if self._macd_cache is not None and self._macd_cache[0] == key:
+            ema_fast, ema_slow, macd, signal = self._macd_cache[1]
 
-        df.loc[:, "ema_slow"] = df["Close"].ewm(
-            span=slow,
-            adjust=False
-        ).mean()
+            df.loc[:, "ema_fast"] = ema_fast
+            df.loc[:, "ema_slow"] = ema_slow
+            df.loc[:, "macd"] = macd
+            df.loc[:, "signal"] = signal
+
+            return df
+
+        if HAVE_NUMBA:
+            # Fused kernel: all four series in one pass over close
+            ema_fast, ema_slow, macd, signal = ewm3(
+                close, self._a_fast, self._a_slow, self._a_sig
+            )
+        else:
+            ema_fast = _ewm_mean(close, self._a_fast)
+            ema_slow = _ewm_mean(close, self._a_slow)
 
-        # MACD and signal line
-        df.loc[:, "macd"] = df["ema_fast"] - df["ema_slow"]
-        df.loc[:, "signal"] = df["macd"].ewm(
-            span=signal_period,
-            adjust=False
-        ).mean()
+            # MACD and signal line
+            macd = ema_fast - ema_slow
+            signal = _ewm_mean(macd, self._a_sig)
+
+        self._macd_cache = (key, (ema_fast, ema_slow, macd, signal))
+
+        df.loc[:, "ema_fast"] = ema_fast
+        df.loc[:, "ema_slow"] = ema_slow
+        df.loc[:, "macd"] = macd
+        df.loc[:, "signal"] = signal
 
         return df
 
@@ -90,13 +268,22 @@ class MACDStrategy:
             self.config["strategy"]["normalization"].get("window", window)
         )
 
-        macd_min = df["macd"].rolling(window).min()
-        macd_max = df["macd"].rolling(window).max()
-
-        denom = (macd_max - macd_min).replace(0, pd.NA)
-        normalized = 2 * ((df["macd"] - macd_min) / denom) - 1
+        # O(n) rolling extrema (bottleneck/numba when installed) and a
+        # NaN-sentinel denominator instead of the object-dtype
+        # .replace(0, pd.NA) promotion path
+        macd_arr = df["macd"].to_numpy(dtype=np.float64)
+        macd_min, macd_max = move_min_max(macd_arr, window)
+
+        # Branchless: where the window range collapses (or is still
+        # warming up and the extrema are NaN), mx > mn is False and
+        # the output is 0 — no NaN intermediate to patch afterwards
+        valid = macd_max > macd_min
+        denom = np.where(valid, macd_max - macd_min, 1.0)
+        normalized = np.where(
+            valid, 2.0 * ((macd_arr - macd_min) / denom) - 1.0, 0.0
+        )
 
-        df.loc[:, "normalized_macd"] = normalized.fillna(0.0)
+        df.loc[:, "normalized_macd"] = normalized
 
         return df
 
@@ -108,22 +295,15 @@ class MACDStrategy:
         Calculates position size using risk-based sizing.
         """
 
-        ps = self.config["strategy"]["position_sizing"]
-
-        if not ps["enabled"]:
+        if not self._ps_enabled:
             return 1
 
-        balance = ps["account_balance"]
-        risk_fraction = ps["risk_per_trade"]
-        stop_loss_pct = ps["stop_loss_pct"]
-
-        risk_amount = balance * risk_fraction
-        stop_loss_distance = price * stop_loss_pct
+        stop_loss_distance = price * self._stop_pct
 
         if stop_loss_distance <= 0:
             return 1
 
-        size = int(risk_amount / stop_loss_distance)
+        size = int(self._risk_amount / stop_loss_distance)
 
         return max(size, 1)
 
@@ -136,17 +316,15 @@ class MACDStrategy:
         buy_thr = thresholds["normalized_buy"]
         sell_thr = thresholds["normalized_sell"]
 
-        df.loc[:, "signal_flag"] = "HOLD"
-
-        df.loc[
-            df["normalized_macd"] <= buy_thr,
-            "signal_flag"
-        ] = "BUY"
-
-        df.loc[
-            df["normalized_macd"] >= sell_thr,
-            "signal_flag"
-        ] = "SELL"
+        # int8 codes (BUY=1, SELL=-1, HOLD=0) instead of an object
+        # column of strings: 1 byte per bar and branchless to compare
+        # in the backtest kernel
+        nm = df["normalized_macd"].to_numpy()
+        df.loc[:, "signal_code"] = np.select(
+            [nm <= buy_thr, nm >= sell_thr],
+            [np.int8(1), np.int8(-1)],
+            default=np.int8(0),
+        )
 
         return df
 
@@ -158,88 +336,163 @@ class MACDStrategy:
         Executes a long-only backtest with:
           - Commission per trade
           - Percentage slippage
+
+        The bar-by-bar state machine runs over raw Close/signal
+        arrays via backtest_dispatch — a compiled dense kernel under
+        numba, or a sparse event loop with vectorized segment equity
+        otherwise; only the trade-log rows are rebuilt as Python
+        objects afterwards.
         """
 
         initial_capital = self.config["strategy"]["backtest"]["initial_capital"]
-        capital = float(initial_capital)
-        position = 0
 
         commission = self.config["strategy"].get("commission_per_trade", 0.0)
         slippage = self.config["strategy"].get("slippage_pct", 0.0)
 
-        # Initialize tracking columns
-        df.loc[:, "position_size"] = 0
-        df.loc[:, "equity"] = float(capital)
-
-        trades = []
-        entry_price_eff = None
-        entry_index = None
-
-        for index, row in df.iterrows():
-
-            # Safe scalar extraction
-            close_val = row["Close"]
-            price = close_val.item() if hasattr(close_val, "item") else float(close_val)
-
-            signal = str(row.get("signal_flag", "HOLD")).strip()
-
-            # ----------------------------------------------------------
-            # BUY
-            # ----------------------------------------------------------
-            if signal == "BUY" and position == 0:
-                size = self.calculate_position_size(price)
-
-                if size > 0:
-                    entry_price_eff = price * (1.0 + slippage)
-                    cost = (size * entry_price_eff) + commission
-
-                    if cost <= capital:
-                        capital -= cost
-                        position = size
-                        entry_index = index
-                        df.loc[index, "position_size"] = size
-
-            # ----------------------------------------------------------
-            # SELL
-            # ----------------------------------------------------------
-            elif signal == "SELL" and position > 0:
-                exit_price_eff = price * (1.0 - slippage)
-
-                capital += (position * exit_price_eff) - commission
-
-                pnl = (
-                    (exit_price_eff - entry_price_eff) * position
-                    - (2 * commission)
-                )
-
-                trades.append({
-                    "entry_date": entry_index,
-                    "entry_price": entry_price_eff,
-                    "exit_date": index,
-                    "exit_price": exit_price_eff,
-                    "position_size": position,
-                    "pnl": pnl,
-                })
-
-                position = 0
-                df.loc[index, "position_size"] = 0
-
-            # ----------------------------------------------------------
-            # Equity update (mark-to-market)
-            # ----------------------------------------------------------
-            df.loc[index, "equity"] = float(
-                capital + (position * price)
-            )
+        close = df["Close"].to_numpy(dtype=np.float64)
+
+        if "signal_code" in df.columns:
+            codes = df["signal_code"].to_numpy(dtype=np.int8)
+        elif "signal_flag" in df.columns:
+            # Back-compat for frames carrying the old string column
+            flags = df["signal_flag"].to_numpy()
+            codes = np.where(
+                flags == "BUY", 1, np.where(flags == "SELL", -1, 0)
+            ).astype(np.int8)
+        else:
+            codes = np.zeros(len(df), dtype=np.int8)
+
+        (
+            position_size,
+            equity,
+            entry_idx,
+            exit_idx,
+            entry_price,
+            exit_price,
+            trade_size,
+            pnl,
+            n_trades,
+        ) = backtest_dispatch(
+            close,
+            codes,
+            float(initial_capital),
+            float(commission),
+            float(slippage),
+            self._ps_enabled,
+            self._risk_amount,
+            self._stop_pct,
+        )
+
+        df.loc[:, "position_size"] = position_size.astype(np.int64)
+        df.loc[:, "equity"] = equity
 
         # --------------------------------------------------------------
-        # Save trade log only if enabled
+        # Trade log: rows are kept on the instance for in-memory
+        # consumers; the CSV write only happens when logging is on
+        # and there is something to write, so sweep/walk-forward runs
+        # that trade nothing skip the I/O entirely
         # --------------------------------------------------------------
-        if self.config["strategy"].get("log_trades", True):
-            pd.DataFrame(trades).to_csv("trade_log.csv", index=False)
-            print("Trade log saved as trade_log.csv")
+        # csv writes str(value), so normalize the row types up front:
+        # bare dates (a Timestamp would print a midnight time) and
+        # integer share counts, matching the old pandas-written log
+        entry_dates = df.index[entry_idx[:n_trades]]
+        exit_dates = df.index[exit_idx[:n_trades]]
+        if isinstance(df.index, pd.DatetimeIndex):
+            entry_dates = entry_dates.date
+            exit_dates = exit_dates.date
+
+        trades = [
+            {
+                "entry_date": entry_dates[k],
+                "entry_price": entry_price[k],
+                "exit_date": exit_dates[k],
+                "exit_price": exit_price[k],
+                "position_size": int(trade_size[k]),
+                "pnl": pnl[k],
+            }
+            for k in range(n_trades)
+        ]
+        self.last_trades = trades
+
+        if trades and self.config["strategy"].get("log_trades", True):
+            self._log_trades(trades)
 
         return df
 
+    # ------------------------------------------------------------------
+    # Split pipeline: indicators vs thresholds
+    # ------------------------------------------------------------------
+    def compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes MACD and normalized MACD only.
+
+        The indicator series do not depend on the buy/sell thresholds,
+        so parameter sweeps can call this once and then re-apply
+        thresholds per (buy, sell) pair.
+        """
+
+        df = self.compute_macd(df)
+        df = self.compute_normalized_macd(df)
+        return df
+
+    def apply_thresholds(
+        self,
+        df: pd.DataFrame,
+        buy_thr: float,
+        sell_thr: float,
+    ) -> pd.DataFrame:
+        """
+        Generates signals from precomputed indicators using explicit
+        thresholds, then runs the backtest. `df` must already contain
+        `normalized_macd` (see compute_indicators).
+        """
+
+        nm = df["normalized_macd"].to_numpy()
+        df.loc[:, "signal_code"] = np.select(
+            [nm <= buy_thr, nm >= sell_thr],
+            [np.int8(1), np.int8(-1)],
+            default=np.int8(0),
+        )
+
+        return self.run_backtest(df)
+
+    # ------------------------------------------------------------------
+    # Parallel execution over many configs
+    # ------------------------------------------------------------------
+    @classmethod
+    def run_many(cls, configs, df: pd.DataFrame, max_workers=None) -> list:
+        """
+        Runs one backtest per config over the same price frame,
+        fanned out across processes. The frame is broadcast to each
+        worker once via the pool initializer, and when every config
+        agrees on the macd/normalization settings the indicator
+        series are computed once in the parent and shared, so workers
+        only run signals + backtest.
+
+        Returns the result DataFrames in config order.
+        """
+        configs = list(configs)
+        if not configs:
+            return []
+
+        first = configs[0]["strategy"]
+        shared = all(
+            c["strategy"]["macd"] == first["macd"]
+            and c["strategy"]["normalization"] == first["normalization"]
+            for c in configs
+        )
+
+        df_in = df
+        if shared:
+            df_in = cls(configs[0]).compute_indicators(df.copy())
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_run_many_worker,
+            initargs=(df_in, shared),
+        ) as executor:
+            return list(executor.map(_run_many_one, configs))
+
     # ------------------------------------------------------------------
     # FULL STRATEGY PIPELINE (entry point)
     # ------------------------------------------------------------------
@@ -248,8 +501,18 @@ class MACDStrategy:
         Full execution pipeline.
         """
 
-        df = self.compute_macd(df)
-        df = self.compute_normalized_macd(df)
+        self._precompute_config()
+
+        # Coerce Close to contiguous float64 once so every later
+        # to_numpy(dtype=float64) is a zero-copy view, even when the
+        # source CSV parsed the column as int or object. Plain column
+        # assignment (not .loc) so the dtype is actually replaced
+        # rather than cast back into the existing block.
+        df["Close"] = pd.to_numeric(df["Close"], errors="coerce").astype(
+            np.float64, copy=False
+        )
+
+        df = self.compute_indicators(df)
         df = self.generate_signals(df)
         df = self.run_backtest(df)
 
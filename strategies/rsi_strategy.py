@@ -3,43 +3,71 @@
 from strategies.base_strategy import BaseStrategy
 
 class RSIStrategy(BaseStrategy):
+    """
+    RSI strategy with O(1) per-tick state.
+
+    Instead of rebuilding gain/loss lists over the whole price history
+    on every decide() call, two scalar averages are maintained with
+    Wilder's recursive update avg = (avg*(w-1) + new)/w — constant
+    time and constant memory no matter how long the bot runs.
+    """
+
     def __init__(self, config, logger):
         super().__init__(config, logger)
         self.window = config.get("strategy", {}).get("rsi_window", 14)
-        self.prices = []
 
-    def _calculate_rsi(self, prices):
-        if len(prices) < self.window:
+        # Incremental Wilder state
+        self.prev_price = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+
+    def _update_rsi(self, price):
+        """
+        Feed one price into the Wilder state. Returns the RSI, or
+        None until `window` deltas have been observed.
+        """
+        if self.prev_price is None:
+            self.prev_price = price
             return None
 
-        gains = []
-        losses = []
+        delta = price - self.prev_price
+        self.prev_price = price
+
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
 
-        for i in range(1, len(prices)):
-            delta = prices[i] - prices[i-1]
-            if delta > 0:
-                gains.append(delta)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(delta))
+        w = self.window
+        self.count += 1
 
-        avg_gain = sum(gains[-self.window:]) / self.window
-        avg_loss = sum(losses[-self.window:]) / self.window if sum(losses[-self.window:]) != 0 else 1e-6
+        if self.count < w:
+            # Warm-up: accumulate plain sums for the seed averages
+            self._gain_sum += gain
+            self._loss_sum += loss
+            return None
+
+        if self.count == w:
+            self._gain_sum += gain
+            self._loss_sum += loss
+            self.avg_gain = self._gain_sum / w
+            self.avg_loss = self._loss_sum / w
+        else:
+            self.avg_gain = (self.avg_gain * (w - 1) + gain) / w
+            self.avg_loss = (self.avg_loss * (w - 1) + loss) / w
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        avg_loss = self.avg_loss if self.avg_loss != 0 else 1e-6
 
-        return rsi
+        rs = self.avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
 
     def decide(self, market_data):
         price = market_data.get("price")
         if price is None:
             return None
 
-        self.prices.append(price)
-
-        rsi = self._calculate_rsi(self.prices)
+        rsi = self._update_rsi(price)
 
         if rsi is None:
             return None
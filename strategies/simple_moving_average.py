@@ -1,6 +1,7 @@
 # strategies/simple_moving_average.py
 
-from statistics import mean
+import numpy as np
+
 from strategies.base_strategy import BaseStrategy
 
 class SimpleMovingAverageStrategy(BaseStrategy):
@@ -8,8 +9,12 @@ class SimpleMovingAverageStrategy(BaseStrategy):
         super().__init__(config, logger)
         self.window = config.get("strategy", {}).get("sma_window", 5)
 
-        # Store recent prices
-        self.prices = []
+        # Preallocated ring buffer plus a running sum: each decide()
+        # is O(1) and memory stays bounded at `window` floats
+        self._buf = np.empty(self.window, dtype=np.float64)
+        self._head = 0
+        self._filled = 0
+        self.sum = 0.0
 
     def decide(self, market_data):
         price = market_data.get("price")
@@ -18,17 +23,21 @@ class SimpleMovingAverageStrategy(BaseStrategy):
             self.logger.info("No price available. Skipping strategy decision.")
             return None
 
-        self.prices.append(price)
+        # Overwrite the oldest slot, subtracting the value it held
+        if self._filled == self.window:
+            self.sum -= self._buf[self._head]
+        else:
+            self._filled += 1
 
-        # Maintain window size
-        if len(self.prices) > self.window:
-            self.prices.pop(0)
+        self._buf[self._head] = price
+        self._head = (self._head + 1) % self.window
+        self.sum += price
 
         # Not enough data yet
-        if len(self.prices) < self.window:
+        if self._filled < self.window:
             return None
 
-        avg_price = mean(self.prices)
+        avg_price = self.sum / self.window
 
         self.logger.info(f"SMA: {avg_price}, Current Price: {price}")
 